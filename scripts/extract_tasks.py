@@ -30,6 +30,38 @@ TASK_PATTERNS = [
     (r'^\d+[.)]\s*([A-Z][a-z]+(?:\s+[a-z]+)*\s+(?:to|for|on|complete|finish|review|create|add|set up|post|analyze|update)\b.+)', 'medium'),
 ]
 
+# LLM prompt template; extract_prompt() puts the notes between these
+_PROMPT_PREFIX = """Extract action items from these meeting notes and format each as a task.
+
+For each task, determine:
+- title: Brief, actionable title (verb + noun)
+- priority: high (blocking/deadline/revenue), medium (important), low (nice-to-have)
+- due: Date if mentioned, ASAP if urgent, or leave blank
+- owner: Person responsible (default: martin)
+- blocks: Who/what is blocked if this isn't done
+
+Meeting Notes:
+---
+"""
+
+_PROMPT_SUFFIX = """
+---
+
+Output each task as a command:
+```
+tasks.py add "Task title" --priority high --due YYYY-MM-DD --blocks "person (reason)"
+```
+
+Only output the commands, one per line. No explanations."""
+
+# Printed after the prompt in --llm mode
+_LLM_NOTE = """
+
+---
+NOTE: This output is meant for LLM processing.
+The LLM should parse meeting notes and call tasks.py add for each task.
+"""
+
 
 def extract_tasks_local(text: str) -> list[dict]:
     """Extract tasks using regex patterns (fast, local)."""
@@ -85,26 +117,7 @@ def format_task_command(task: dict) -> str:
 
 def extract_prompt(text: str) -> str:
     """Generate a prompt for LLM to extract tasks (for complex notes)."""
-    return f"""Extract action items from these meeting notes and format each as a task.
-
-For each task, determine:
-- title: Brief, actionable title (verb + noun)
-- priority: high (blocking/deadline/revenue), medium (important), low (nice-to-have)
-- due: Date if mentioned, ASAP if urgent, or leave blank
-- owner: Person responsible (default: martin)
-- blocks: Who/what is blocked if this isn't done
-
-Meeting Notes:
----
-{text}
----
-
-Output each task as a command:
-```
-tasks.py add "Task title" --priority high --due YYYY-MM-DD --blocks "person (reason)"
-```
-
-Only output the commands, one per line. No explanations."""
+    return _PROMPT_PREFIX + text + _PROMPT_SUFFIX
 
 
 def main():
@@ -134,10 +147,7 @@ def main():
     
     if args.llm:
         # Output LLM prompt
-        print(extract_prompt(text))
-        print("\n---")
-        print("NOTE: This output is meant for LLM processing.")
-        print("The LLM should parse meeting notes and call tasks.py add for each task.")
+        sys.stdout.write(extract_prompt(text) + _LLM_NOTE)
     else:
         # Local extraction using regex
         tasks = extract_tasks_local(text)
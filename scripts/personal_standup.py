@@ -13,7 +13,7 @@ from pathlib import Path
 
 # Add parent directory to path for utils import
 sys.path.insert(0, str(Path(__file__).parent))
-from utils import load_tasks, check_due_date, get_section_display_name
+from utils import load_tasks, check_due_date, get_section_display_name, task_json
 
 
 def get_calendar_events() -> dict:
@@ -99,43 +99,43 @@ def format_personal_standup(output: dict, date_display: str) -> str:
     
     # #1 Priority
     if output['priority']:
-        lines.append(f"🎯 **#1 Priority:** {output['priority']['title']}")
+        lines.append(f"🎯 **#1 Priority:** {output['priority'].title}")
         lines.append("")
     
     # Due Today
     if output['due_today']:
         lines.append("⏰ **Due Today:**")
         for t in output['due_today']:
-            lines.append(f"  • {t['title']}")
+            lines.append(f"  • {t.title}")
         lines.append("")
     
     # Q1 Must Do
     if output['q1']:
         lines.append("🔴 **Must Do Today:**")
         for t in output['q1']:
-            lines.append(f"  • {t['title']}")
+            lines.append(f"  • {t.title}")
         lines.append("")
     
     # Q2 Should Do
     if output['q2']:
         lines.append("🟡 **Should Do This Week:**")
         for t in output['q2']:
-            due_str = f" (🗓️{t['due']})" if t.get('due') else ""
-            lines.append(f"  • {t['title']}{due_str}")
+            due_str = f" (🗓️{t.due})" if t.due else ""
+            lines.append(f"  • {t.title}{due_str}")
         lines.append("")
     
     # Q3 Waiting On
     if output['q3']:
         lines.append("🟠 **Waiting On:**")
         for t in output['q3']:
-            lines.append(f"  • {t['title']}")
+            lines.append(f"  • {t.title}")
         lines.append("")
     
     # Completed
     if output['completed']:
         lines.append(f"✅ **Completed:** ({len(output['completed'])} items)")
         for t in output['completed'][:5]:  # Limit to 5
-            lines.append(f"  • {t['title']}")
+            lines.append(f"  • {t.title}")
         if len(output['completed']) > 5:
             lines.append(f"  • ... and {len(output['completed']) - 5} more")
     
@@ -144,7 +144,7 @@ def format_personal_standup(output: dict, date_display: str) -> str:
 
 def generate_personal_standup(date_str: str = None, json_output: bool = False) -> str | dict:
     """Generate personal daily standup summary."""
-    _, tasks_data = load_tasks(personal=True)
+    tasks_data = load_tasks(personal=True)
     
     today = datetime.now()
     if date_str:
@@ -192,7 +192,7 @@ def main():
     result = generate_personal_standup(date_str=args.date, json_output=args.json)
     
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json.dumps(result, indent=2, default=task_json))
     else:
         print(result)
 
@@ -11,7 +11,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from utils import load_tasks, check_due_date
+from utils import load_tasks, check_due_date, task_json
 
 
 def get_calendar_events() -> dict:
@@ -96,7 +96,7 @@ def group_by_area(tasks):
     """Group tasks by area."""
     areas = {}
     for t in tasks:
-        area = t.get('area', 'Uncategorized')
+        area = t.area or 'Uncategorized'
         if area not in areas:
             areas[area] = []
         areas[area].append(t)
@@ -120,7 +120,7 @@ def format_split_standup(output: dict, date_display: str) -> list:
         for cat in sorted(by_area.keys()):
             msg1_lines.append(f"**{cat}:**")
             for t in by_area[cat]:
-                msg1_lines.append(f"  • {t['title']}")
+                msg1_lines.append(f"  • {t.title}")
             msg1_lines.append("")
     else:
         msg1_lines.append("_No completed items_")
@@ -150,16 +150,16 @@ def format_split_standup(output: dict, date_display: str) -> list:
     # #1 Priority
     if output['priority']:
         priority = output['priority']
-        msg3_lines.append(f"🎯 **#1 Priority:** {priority['title']}")
-        if priority.get('blocks'):
-            msg3_lines.append(f"   ↳ Blocking: {priority['blocks']}")
+        msg3_lines.append(f"🎯 **#1 Priority:** {priority.title}")
+        if priority.blocks:
+            msg3_lines.append(f"   ↳ Blocking: {priority.blocks}")
         msg3_lines.append("")
     
     # Due today
     if output['due_today']:
         msg3_lines.append("⏰ **Due Today:**")
         for t in output['due_today']:
-            msg3_lines.append(f"  • {t['title']}")
+            msg3_lines.append(f"  • {t.title}")
         msg3_lines.append("")
     
     # Q1 - Urgent & Important
@@ -169,7 +169,7 @@ def format_split_standup(output: dict, date_display: str) -> list:
         for area in sorted(by_area.keys()):
             msg3_lines.append(f"  **{area}:**")
             for t in by_area[area]:
-                msg3_lines.append(f"    • {t['title']}")
+                msg3_lines.append(f"    • {t.title}")
         msg3_lines.append("")
     
     # Q2 - Important, Not Urgent
@@ -179,24 +179,24 @@ def format_split_standup(output: dict, date_display: str) -> list:
         for area in sorted(by_area.keys()):
             msg3_lines.append(f"  **{area}:**")
             for t in by_area[area]:
-                due_str = f" (🗓️{t['due']})" if t.get('due') else ""
-                msg3_lines.append(f"    • {t['title']}{due_str}")
+                due_str = f" (🗓️{t.due})" if t.due else ""
+                msg3_lines.append(f"    • {t.title}{due_str}")
         msg3_lines.append("")
     
     # Q3 - Waiting/Blocked
     if output.get('q3'):
         msg3_lines.append("🟠 **Waiting/Blocked (Q3):**")
         for t in output['q3']:
-            blocks_str = f" → {t['blocks']}" if t.get('blocks') else ""
-            msg3_lines.append(f"  • {t['title']}{blocks_str}")
+            blocks_str = f" → {t.blocks}" if t.blocks else ""
+            msg3_lines.append(f"  • {t.title}{blocks_str}")
         msg3_lines.append("")
     
     # Team tasks
     if output.get('team'):
         msg3_lines.append("👥 **Team Tasks:**")
         for t in output['team']:
-            owner_str = f" ({t['owner']})" if t.get('owner') else ""
-            msg3_lines.append(f"  • {t['title']}{owner_str}")
+            owner_str = f" ({t.owner})" if t.owner else ""
+            msg3_lines.append(f"  • {t.title}{owner_str}")
     
     messages.append('\n'.join(msg3_lines).strip())
     
@@ -213,7 +213,7 @@ def generate_standup(date_str: str = None, json_output: bool = False, split_outp
     Returns:
         String summary (default) or dict if json_output=True
     """
-    _, tasks_data = load_tasks()
+    tasks_data = load_tasks()
     
     today = datetime.now()
     if date_str:
@@ -289,15 +289,15 @@ def generate_standup(date_str: str = None, json_output: bool = False, split_outp
     
     if output['priority']:
         priority = output['priority']
-        lines.append(f"🎯 **#1 Priority:** {priority['title']}")
-        if priority.get('blocks'):
-            lines.append(f"   ↳ Blocking: {priority['blocks']}")
+        lines.append(f"🎯 **#1 Priority:** {priority.title}")
+        if priority.blocks:
+            lines.append(f"   ↳ Blocking: {priority.blocks}")
         lines.append("")
     
     if output['due_today']:
         lines.append("⏰ **Due Today:**")
         for t in output['due_today']:
-            lines.append(f"  • {t['title']}")
+            lines.append(f"  • {t.title}")
         lines.append("")
     
     # Q1 - Urgent & Important
@@ -307,7 +307,7 @@ def generate_standup(date_str: str = None, json_output: bool = False, split_outp
         for cat in sorted(by_area.keys()):
             lines.append(f"  **{cat}:**")
             for t in by_area[cat]:
-                lines.append(f"    • {t['title']}")
+                lines.append(f"    • {t.title}")
         lines.append("")
     
     # Q2 - Important, Not Urgent
@@ -317,30 +317,30 @@ def generate_standup(date_str: str = None, json_output: bool = False, split_outp
         for cat in sorted(by_area.keys()):
             lines.append(f"  **{cat}:**")
             for t in by_area[cat]:
-                due_str = f" (🗓️{t['due']})" if t.get('due') else ""
-                lines.append(f"    • {t['title']}{due_str}")
+                due_str = f" (🗓️{t.due})" if t.due else ""
+                lines.append(f"    • {t.title}{due_str}")
         lines.append("")
     
     # Q3 - Waiting/Blocked
     if output['q3']:
         lines.append("🟠 **Waiting/Blocked (Q3):**")
         for t in output['q3']:
-            blocks_str = f" → {t['blocks']}" if t.get('blocks') else ""
-            lines.append(f"  • {t['title']}{blocks_str}")
+            blocks_str = f" → {t.blocks}" if t.blocks else ""
+            lines.append(f"  • {t.title}{blocks_str}")
         lines.append("")
     
     # Team tasks
     if output['team']:
         lines.append("👥 **Team Tasks:**")
         for t in output['team']:
-            owner_str = f" ({t['owner']})" if t.get('owner') else ""
-            lines.append(f"  • {t['title']}{owner_str}")
+            owner_str = f" ({t.owner})" if t.owner else ""
+            lines.append(f"  • {t.title}{owner_str}")
         lines.append("")
     
     if output['completed']:
         lines.append(f"✅ **Recently Completed:** ({len(output['completed'])} items)")
         for t in output['completed'][:5]:  # Limit to 5
-            lines.append(f"  • {t['title']}")
+            lines.append(f"  • {t.title}")
         if len(output['completed']) > 5:
             lines.append(f"  • ... and {len(output['completed']) - 5} more")
     
@@ -358,7 +358,7 @@ def main():
     result = generate_standup(date_str=args.date, json_output=args.json, split_output=args.split)
     
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json.dumps(result, indent=2, default=task_json))
     elif args.split:
         # Print 3 messages separated by double newlines
         for i, msg in enumerate(result, 1):
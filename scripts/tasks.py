@@ -7,7 +7,7 @@ Usage:
     tasks.py --personal list
     tasks.py add "Task title" [--priority high|medium|low] [--due YYYY-MM-DD]
     tasks.py done "task query"
-    tasks.py blockers [--person NAME]
+    tasks.py blockers [--person NAME] [--all]
     tasks.py archive
 """
 
@@ -22,20 +22,16 @@ from utils import (
     get_section_display_name,
     parse_tasks,
     load_tasks,
+    load_all_tasks,
     check_due_date,
     get_current_quarter,
-    ARCHIVE_DIR,
+    get_archive_dir,
 )
 
 
 def list_tasks(args):
     """List tasks with optional filters."""
-    _, tasks_data = load_tasks(args.personal)
-    tasks = tasks_data['all']
-    
-    # Apply filters
-    filtered = tasks
-    
+    target_key = None
     if args.priority:
         priority_map = {
             'high': 'q1',
@@ -43,11 +39,16 @@ def list_tasks(args):
             'low': 'backlog',
         }
         target_key = priority_map.get(args.priority.lower())
-        if target_key:
-            filtered = tasks_data.get(target_key, [])
+    
+    # Tasks outside the listed bucket are skipped while parsing
+    bucket = target_key or 'all'
+    tasks_data = load_tasks(args.personal, needed=frozenset({bucket}))
+    
+    # Apply filters
+    filtered = tasks_data[bucket]
     
     if args.due:
-        filtered = [t for t in filtered if check_due_date(t.get('due', ''), args.due)]
+        filtered = [t for t in filtered if check_due_date(t.due, args.due)]
     
     if not filtered:
         task_type = "Personal" if args.personal else "Work"
@@ -58,16 +59,16 @@ def list_tasks(args):
     
     current_section = None
     for task in filtered:
-        section = task.get('section')
+        section = task.section
         if section != current_section:
             current_section = section
             print(f"### {get_section_display_name(section, args.personal)}\n")
         
-        checkbox = '✅' if task['done'] else '⬜'
-        due_str = f" (🗓️{task['due']})" if task.get('due') else ''
-        area_str = f" [{task.get('area')}]" if task.get('area') else ''
+        checkbox = '✅' if task.done else '⬜'
+        due_str = f" (🗓️{task.due})" if task.due else ''
+        area_str = f" [{task.area}]" if task.area else ''
         
-        print(f"{checkbox} **{task['title']}**{due_str}{area_str}")
+        print(f"{checkbox} **{task.title}**{due_str}{area_str}")
 
 
 def add_task(args):
@@ -121,6 +122,29 @@ def add_task(args):
         print(f"⚠️ Could not find section matching '{priority_pattern}'. Add manually.")
 
 
+def subsequence_span(query: str, text: str) -> int | None:
+    """Length of the shortest stretch of text containing query's characters in order.
+    
+    Returns None if the characters of query do not all appear in text in
+    order. Smaller spans are tighter matches.
+    """
+    best = None
+    start = text.find(query[0])
+    while start != -1:
+        # Greedy matching from a fixed start gives the earliest end for it
+        ti = start
+        for ch in query[1:]:
+            ti = text.find(ch, ti + 1)
+            if ti == -1:
+                # No later start can complete the match either
+                return best
+        span = ti - start + 1
+        if best is None or span < best:
+            best = span
+        start = text.find(query[0], start + 1)
+    return best
+
+
 def done_task(args):
     """Mark a task as done using fuzzy matching."""
     tasks_file, format = get_tasks_file(args.personal)
@@ -130,46 +154,64 @@ def done_task(args):
         return
     
     content = tasks_file.read_text()
-    tasks_data = parse_tasks(content, args.personal, format)
+    tasks_data = parse_tasks(content, args.personal, format, frozenset({'all'}))
     tasks = tasks_data['all']
     
     query = args.query.lower()
-    matches = [t for t in tasks if query in t['title'].lower() and not t['done']]
+    matches = [t for t in tasks if query in t.title_lower and not t.done]
     
     if not matches:
+        # Suggest close subsequence matches, but never complete a guess
+        max_span = 2 * len(query)
+        suggestions = []
+        for t in tasks:
+            if t.done:
+                continue
+            span = subsequence_span(query, t.title_lower)
+            if span is not None and span <= max_span:
+                suggestions.append((span, t))
+        suggestions.sort(key=lambda item: item[0])
+        
         print(f"No matching task found for: {args.query}")
+        if suggestions:
+            print("Did you mean:")
+            for i, (_, t) in enumerate(suggestions[:3], 1):
+                print(f"  {i}. {t.title}")
         return
     
     if len(matches) > 1:
         print(f"Multiple matches found:")
         for i, t in enumerate(matches, 1):
-            print(f"  {i}. {t['title']}")
+            print(f"  {i}. {t.title}")
         print("\nBe more specific.")
         return
     
     task = matches[0]
     
-    # Update in content - use raw_line (single line)
-    old_line = task.get('raw_line', '')
-    if not old_line:
-        print("⚠️ Could not find task line to update.")
-        return
-    
-    new_line = old_line.replace('- [ ]', '- [x]')
-    
-    new_content = content.replace(old_line, new_line)
+    # Tick the checkbox in place - the task line starts with "- [ ]"
+    offset = task.offset
+    new_content = content[:offset] + '- [x]' + content[offset + 5:]
     tasks_file.write_text(new_content)
     task_type = "Personal" if args.personal else "Work"
-    print(f"✅ Completed {task_type} task: {task['title']}")
+    print(f"✅ Completed {task_type} task: {task.title}")
 
 
 def show_blockers(args):
     """Show tasks that are blocking others."""
-    _, tasks_data = load_tasks(args.personal)
-    blockers = [t for t in tasks_data['all'] if t.get('blocks') and not t['done']]
+    if args.all:
+        # Work and Personal files are read and parsed in parallel
+        sources = [
+            (kind.title(), data['all'])
+            for kind, data in load_all_tasks(frozenset({'all'})).items()
+        ]
+    else:
+        tasks_data = load_tasks(args.personal, needed=frozenset({'all'}))
+        sources = [(None, tasks_data['all'])]
+    
+    blockers = [(label, t) for label, tasks in sources for t in tasks if t.blocks and not t.done]
     
     if args.person:
-        blockers = [t for t in blockers if args.person.lower() in t['blocks'].lower()]
+        blockers = [(label, t) for label, t in blockers if args.person.lower() in t.blocks.lower()]
     
     if not blockers:
         print("No blocking tasks found.")
@@ -177,11 +219,12 @@ def show_blockers(args):
     
     print(f"\n🚧 Blocking Tasks ({len(blockers)} items)\n")
     
-    for task in blockers:
-        print(f"⬜ **{task['title']}**")
-        print(f"   Blocks: {task['blocks']}")
-        if task.get('due'):
-            print(f"   Due: {task['due']}")
+    for label, task in blockers:
+        label_str = f" ({label})" if label else ''
+        print(f"⬜ **{task.title}**{label_str}")
+        print(f"   Blocks: {task.blocks}")
+        if task.due:
+            print(f"   Due: {task.due}")
         print()
 
 
@@ -194,7 +237,7 @@ def archive_done(args):
         return
     
     content = tasks_file.read_text()
-    tasks_data = parse_tasks(content, args.personal, format)
+    tasks_data = parse_tasks(content, args.personal, format, frozenset({'done'}))
     done_tasks = tasks_data['done']
     
     if not done_tasks:
@@ -203,29 +246,29 @@ def archive_done(args):
     
     # Create archive entry
     quarter = get_current_quarter()
-    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
-    archive_file = ARCHIVE_DIR / f"ARCHIVE-{quarter}.md"
+    archive_dir = get_archive_dir()
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    archive_file = archive_dir / f"ARCHIVE-{quarter}.md"
     
     task_type = "Personal" if args.personal else "Work"
     archive_entry = f"\n## Archived {datetime.now().strftime('%Y-%m-%d')} ({task_type})\n\n"
     for task in done_tasks:
-        archive_entry += f"- ✅ **{task['title']}**\n"
-    
-    # Append to archive
-    if archive_file.exists():
-        archive_content = archive_file.read_text()
-    else:
-        archive_content = f"# Task Archive - {quarter}\n"
+        archive_entry += f"- ✅ **{task.title}**\n"
     
-    archive_content += archive_entry
-    archive_file.write_text(archive_content)
+    # Append to archive without rewriting earlier entries
+    if not archive_file.exists():
+        archive_file.write_text(f"# Task Archive - {quarter}\n")
+    with archive_file.open('a') as f:
+        f.write(archive_entry)
     
-    # Remove done tasks from main file
-    new_content = content
+    # Remove done task lines (and their newlines) from main file
+    kept = []
+    prev_end = 0
     for task in done_tasks:
-        raw_line = task.get('raw_line', '')
-        if raw_line:
-            new_content = new_content.replace(raw_line + '\n', '')
+        kept.append(content[prev_end:task.offset])
+        prev_end = task.offset + task.line_len + 1
+    kept.append(content[prev_end:])
+    new_content = ''.join(kept)
     
     tasks_file.write_text(new_content)
     print(f"✅ Archived {len(done_tasks)} {task_type} tasks to {archive_file.name}")
@@ -260,6 +303,7 @@ def main():
     # Blockers command
     blockers_parser = subparsers.add_parser('blockers', help='Show blocking tasks')
     blockers_parser.add_argument('--person', help='Filter by person being blocked')
+    blockers_parser.add_argument('--all', action='store_true', help='Include both Work and Personal tasks')
     blockers_parser.set_defaults(func=show_blockers)
     
     # Archive command
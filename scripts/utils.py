@@ -8,32 +8,139 @@ Configuration via environment variables:
 - TASK_TRACKER_PERSONAL_FILE: Path to personal tasks file
 - TASK_TRACKER_LEGACY_FILE: Path to legacy tasks file (fallback)
 - TASK_TRACKER_ARCHIVE_DIR: Path to archive directory
+- TASK_TRACKER_CACHE_DIR: Path to parsed-task cache directory
 """
 
+import functools
+import hashlib
+import mmap
 import os
+import pickle
 import re
-from datetime import datetime, timedelta
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
 import sys
+from typing import NoReturn
 
-# Configurable paths with sensible defaults
-# Users should set these environment variables for their own setup
-OBSIDIAN_WORK = Path(os.getenv(
-    'TASK_TRACKER_WORK_FILE',
-    Path.home() / "Obsidian" / "03-Areas" / "Work" / "Work Tasks.md"
-))
-OBSIDIAN_PERSONAL = Path(os.getenv(
-    'TASK_TRACKER_PERSONAL_FILE',
-    Path.home() / "Obsidian" / "03-Areas" / "Personal" / "Personal Tasks.md"
-))
-LEGACY_WORK = Path(os.getenv(
-    'TASK_TRACKER_LEGACY_FILE',
-    Path.home() / "clawd" / "memory" / "work" / "TASKS.md"
-))
-ARCHIVE_DIR = Path(os.getenv(
-    'TASK_TRACKER_ARCHIVE_DIR',
-    Path.home() / "clawd" / "memory" / "work"
-))
+
+@functools.cache
+def _paths() -> dict[str, Path]:
+    """Resolve configured paths on first use rather than at import time."""
+    home = Path.home()
+    # Configurable paths with sensible defaults
+    # Users should set these environment variables for their own setup
+    return {
+        'OBSIDIAN_WORK': Path(os.getenv(
+            'TASK_TRACKER_WORK_FILE',
+            home / "Obsidian" / "03-Areas" / "Work" / "Work Tasks.md"
+        )),
+        'OBSIDIAN_PERSONAL': Path(os.getenv(
+            'TASK_TRACKER_PERSONAL_FILE',
+            home / "Obsidian" / "03-Areas" / "Personal" / "Personal Tasks.md"
+        )),
+        'LEGACY_WORK': Path(os.getenv(
+            'TASK_TRACKER_LEGACY_FILE',
+            home / "clawd" / "memory" / "work" / "TASKS.md"
+        )),
+        'ARCHIVE_DIR': Path(os.getenv(
+            'TASK_TRACKER_ARCHIVE_DIR',
+            home / "clawd" / "memory" / "work"
+        )),
+        'CACHE_DIR': Path(os.getenv(
+            'TASK_TRACKER_CACHE_DIR',
+            home / ".cache" / "task-tracker"
+        )),
+    }
+
+
+def __getattr__(name: str) -> Path:
+    """Keep OBSIDIAN_WORK, ARCHIVE_DIR, etc. importable as module constants."""
+    try:
+        return _paths()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+# Inline metadata patterns for Obsidian task lines, compiled once
+_DUE_DATE_RE = re.compile(r'🗓️(\d{4}-\d{2}-\d{2})')
+# Inline fields are searched independently so one field's value can't
+# hide another. area:: values may span several words up to the next
+# "field::"; goal:: may be a [[wiki link]].
+_AREA_RE = re.compile(r'area::\s*([^\n]+?)(?=\s+\w+::|$)')
+_GOAL_RE = re.compile(r'goal::\s*(\[\[[^\]]+\]\]|[^\s]+)')
+_OWNER_RE = re.compile(r'owner::\s*([^\s]+)')
+
+# Tasks store their section as an index into these tuples
+SECTION_KEYS = ('q1', 'q2', 'q3', 'team', 'backlog', 'done')
+# Every bucket parse_tasks can fill
+ALL_BUCKETS = frozenset(SECTION_KEYS + ('due_today', 'all'))
+_SECTION_NAMES_WORK = (
+    '🔴 Q1: Urgent & Important',
+    '🟡 Q2: Important, Not Urgent',
+    '🟠 Q3: Waiting / Blocked',
+    '👥 Team Tasks',
+    '⚪ Backlog',
+    '✅ Done',
+)
+_SECTION_NAMES_PERSONAL = (
+    '🔴 Must Do Today',
+    '🟡 Should Do This Week',
+    '🟠 Waiting On',
+    '👥 Team Tasks',
+    '⚪ Backlog',
+    '✅ Done',
+)
+
+# Bump when parse_tasks output changes shape so stale caches are ignored
+_CACHE_VERSION = 9
+
+
+@dataclass(slots=True)
+class Task:
+    """A single task line parsed from a tasks file."""
+    title: str
+    title_lower: str
+    done: bool
+    section: int | None  # Index into SECTION_KEYS
+    due: str | None
+    area: str | None
+    goal: str | None
+    owner: str | None
+    blocks: str | None
+    # Character span of the task line in the text given to parse_tasks;
+    # both are None for tasks from parse_tasks_bytes/load_tasks
+    offset: int | None
+    line_len: int | None
+
+
+def task_json(obj: object) -> dict:
+    """json.dumps default= hook that renders a Task with its public fields."""
+    if not isinstance(obj, Task):
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return {
+        'title': obj.title,
+        'done': obj.done,
+        'section': SECTION_KEYS[obj.section] if obj.section is not None else None,
+        'due': obj.due,
+        'area': obj.area,
+        'goal': obj.goal,
+        'owner': obj.owner,
+        'blocks': obj.blocks,
+    }
+
+
+def task_raw(content: str, task: Task) -> str:
+    """Return the task's line as it appears in the text it was parsed from.
+    
+    Raises ValueError for tasks from parse_tasks_bytes/load_tasks, which
+    carry no position; parse the text with parse_tasks instead.
+    """
+    if task.offset is None:
+        raise ValueError("Task was parsed from bytes and has no character offset")
+    return content[task.offset:task.offset + task.line_len]
 
 
 def get_current_quarter() -> str:
@@ -43,37 +150,65 @@ def get_current_quarter() -> str:
     return f"{now.year}-Q{quarter}"
 
 
+def get_archive_dir() -> Path:
+    """Return the directory holding quarterly archive files."""
+    return _paths()['ARCHIVE_DIR']
+
+
 def get_tasks_file(personal: bool = False, force_legacy: bool = False) -> tuple[Path, str]:
     """Get the appropriate tasks file and its format.
     
     Returns:
         tuple: (file_path, format) where format is 'obsidian' or 'legacy'
     """
+    paths = _paths()
+    legacy_file = paths['LEGACY_WORK']
+    
     if force_legacy:
-        return LEGACY_WORK, 'legacy'
+        return legacy_file, 'legacy'
     
     # Try Obsidian first
-    obsidian_file = OBSIDIAN_PERSONAL if personal else OBSIDIAN_WORK
+    obsidian_file = paths['OBSIDIAN_PERSONAL' if personal else 'OBSIDIAN_WORK']
     if obsidian_file.exists():
         return obsidian_file, 'obsidian'
     
     # Fall back to legacy for work tasks only
-    if not personal and LEGACY_WORK.exists():
-        return LEGACY_WORK, 'legacy'
+    if not personal and legacy_file.exists():
+        return legacy_file, 'legacy'
     
     # Return Obsidian path anyway (will show error if missing)
     return obsidian_file, 'obsidian'
 
 
-def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian') -> dict:
+def _parse_iso_date(value: str) -> date:
+    """Parse a YYYY-MM-DD date, slicing the common case instead of strptime.
+    
+    Raises ValueError for anything strptime('%Y-%m-%d') would reject.
+    """
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    # Only plain ASCII digits take the fast path; int() would also accept
+    # signs, spaces and underscores that strptime rejects
+    if (len(value) == 10 and value[4] == '-' and value[7] == '-' and value.isascii()
+            and year.isdigit() and month.isdigit() and day.isdigit()):
+        return date(int(year), int(month), int(day))
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian',
+                needed: frozenset[str] = ALL_BUCKETS) -> dict:
     """Parse tasks content into categorized task lists.
     
     Args:
         content: File content to parse
         personal: If True, use personal task categories
         format: 'obsidian' or 'legacy'
+        needed: Buckets to fill; the others are returned empty
+    
+    Each Task's section is an index into SECTION_KEYS (or None), and its
+    offset and line_len locate its line in content so callers can edit
+    that line in place (see task_raw).
     
-    Returns dict with keys:
+    Returns dict of Task lists with keys:
     - q1: list of Q1 (Urgent & Important) tasks
     - q2: list of Q2 (Important, Not Urgent) tasks
     - q3: list of Q3 (Waiting/Blocked) tasks
@@ -83,6 +218,70 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
     - due_today: list of tasks due today
     - all: list of all tasks
     """
+    return _parse_lines(_iter_lines(content), personal, format, needed, False)
+
+
+def parse_tasks_bytes(buf: bytes | mmap.mmap, personal: bool = False, format: str = 'obsidian',
+                      needed: frozenset[str] = ALL_BUCKETS) -> dict:
+    """Parse UTF-8 encoded tasks content, e.g. a memory-mapped file.
+    
+    Same result as parse_tasks, but only header, task and continuation
+    lines are decoded. Character positions aren't tracked, so each Task's
+    offset and line_len are None.
+    """
+    return _parse_lines(_iter_lines_bytes(buf), personal, format, needed, True)
+
+
+def _iter_lines(content: str) -> Iterator[tuple[int, int, str]]:
+    """Yield (start, end, line) for lines that may hold headers or tasks."""
+    # Walk lines by index rather than materialising content.split('\n')
+    pos = 0
+    end = len(content)
+    
+    while pos < end:
+        line_start = pos
+        line_end = content.find('\n', pos)
+        if line_end == -1:
+            line_end = end
+        pos = line_end + 1
+        
+        # Only headers, task lines and indented continuations matter, so
+        # reject blank lines and prose on their first character
+        if content[line_start] not in '#- ':
+            continue
+        
+        yield line_start, line_end, content[line_start:line_end]
+
+
+def _iter_lines_bytes(buf: bytes | mmap.mmap) -> Iterator[tuple[int, int, str]]:
+    """Byte-level _iter_lines that decodes only the lines it yields."""
+    pos = 0
+    end = len(buf)
+    
+    while pos < end:
+        line_start = pos
+        line_end = buf.find(b'\n', pos)
+        if line_end == -1:
+            line_end = end
+        pos = line_end + 1
+        
+        if buf[line_start] not in b'#- ':
+            continue
+        
+        # read_text() would have translated Windows line endings
+        if buf[line_end - 1] == 0x0D:
+            line_end -= 1
+        
+        yield line_start, line_end, buf[line_start:line_end].decode('utf-8')
+
+
+def _parse_lines(lines: Iterable[tuple[int, int, str]], personal: bool, format: str,
+                 needed: frozenset[str], byte_positions: bool) -> dict:
+    """Categorize tasks from (start, end, line) tuples; see parse_tasks.
+    
+    byte_positions says start/end are byte offsets, in which case Tasks
+    get no offset/line_len rather than positions in the wrong unit.
+    """
     result = {
         'q1': [],
         'q2': [],
@@ -94,22 +293,23 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
         'all': [],
     }
     
+    # Section ids index into SECTION_KEYS
     section_mapping = {
-        '🔴': 'q1',
-        '🟡': 'q2',
-        '🟠': 'q3',
-        '👥': 'team',
-        '⚪': 'backlog',
-        '✅': 'done',
+        '🔴': 0,
+        '🟡': 1,
+        '🟠': 2,
+        '👥': 3,
+        '⚪': 4,
+        '✅': 5,
     }
     
     # Personal task sections differ
     personal_section_mapping = {
-        '🔴': 'q1',
-        '🟡': 'q2',
-        '🟠': 'q3',
-        '⚪': 'backlog',
-        '✅': 'done',
+        '🔴': 0,
+        '🟡': 1,
+        '🟠': 2,
+        '⚪': 4,
+        '✅': 5,
     }
     
     mapping = personal_section_mapping if personal else section_mapping
@@ -118,29 +318,39 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
     current_task = None
     today = datetime.now().date()
     
-    for line in content.split('\n'):
+    # Section emojis recognised in each format's "## " headers
+    header_emojis = '🔴🟡🟠👥⚪✅' if format == 'obsidian' else '🔴🟡🟢📅✅'
+    
+    # When only section buckets are needed (e.g. list --priority high),
+    # tasks that can't land in one are skipped before parsing their fields
+    sections_only = needed.isdisjoint(('all', 'due_today'))
+    wanted_sections = {i for i, key in enumerate(SECTION_KEYS) if key in needed}
+    
+    for line_start, line_end, line in lines:
         # Detect section headers
         if line.startswith('## '):
-            if format == 'obsidian':
-                # Match emoji at start of section name
-                section_match = re.match(r'## ([🔴🟡🟠👥⚪✅])', line)
-            else:
-                # Legacy format: ## 🔴 High Priority
-                section_match = re.match(r'## ([🔴🟡🟢📅✅])', line)
-            
-            if section_match:
-                emoji = section_match.group(1)
+            # Emoji at start of section name, e.g. ## 🔴 High Priority
+            emoji = line[3:4]
+            if emoji and emoji in header_emojis:
                 current_section = mapping.get(emoji)
             continue
         
         # Detect task line
         # Format: - [ ] **Task name** 🗓️2026-01-22 area:: Sales
-        task_match = re.match(r'^- \[([ xX])\] \*\*(.+?)\*\*(.*)$', line)
+        title_end = -1
+        if (line.startswith('- [') and line[3:4] in (' ', 'x', 'X')
+                and line.startswith('] **', 4)):
+            title_end = line.find('**', 9)
         
-        if task_match:
-            done = task_match.group(1).lower() == 'x'
-            title = task_match.group(2).strip()
-            rest = task_match.group(3).strip()
+        if title_end != -1:
+            done = line[3] != ' '
+            if sections_only and not (
+                    'done' in needed if done else current_section in wanted_sections):
+                current_task = None  # Keep its metadata lines off the previous task
+                continue
+            
+            title = line[8:title_end].strip()
+            rest = line[title_end + 2:].strip()
             
             due_str = None
             area = None
@@ -150,46 +360,52 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
             
             if format == 'obsidian':
                 # Parse emoji date
-                date_match = re.search(r'🗓️(\d{4}-\d{2}-\d{2})', rest)
+                date_match = _DUE_DATE_RE.search(rest)
                 if date_match:
                     due_str = date_match.group(1)
                 
                 # Parse inline fields (handle multi-word values)
-                area_match = re.search(r'area::\s*([^\n]+?)(?=\s+\w+::|$)', rest)
+                area_match = _AREA_RE.search(rest)
                 if area_match:
                     area = area_match.group(1).strip()
                 
-                goal_match = re.search(r'goal::\s*(\[\[[^\]]+\]\]|[^\s]+)', rest)
+                goal_match = _GOAL_RE.search(rest)
                 if goal_match:
                     goal = goal_match.group(1).strip()
                 
-                owner_match = re.search(r'owner::\s*([^\s]+)', rest)
+                owner_match = _OWNER_RE.search(rest)
                 if owner_match:
                     owner = owner_match.group(1).strip()
             
-            current_task = {
-                'title': title,
-                'done': done,
-                'section': current_section,
-                'due': due_str,
-                'area': area,
-                'goal': goal,
-                'owner': owner,
-                'blocks': blocks,
-                'raw_line': line,
-            }
+            current_task = Task(
+                title=title,
+                title_lower=title.lower(),
+                done=done,
+                section=current_section,
+                due=due_str,
+                area=area,
+                goal=goal,
+                owner=owner,
+                blocks=blocks,
+                offset=None if byte_positions else line_start,
+                line_len=None if byte_positions else line_end - line_start,
+            )
             
-            result['all'].append(current_task)
+            if 'all' in needed:
+                result['all'].append(current_task)
             
             if done:
-                result['done'].append(current_task)
-            elif current_section:
-                result[current_section].append(current_task)
+                if 'done' in needed:
+                    result['done'].append(current_task)
+            elif current_section is not None:
+                section_key = SECTION_KEYS[current_section]
+                if section_key in needed:
+                    result[section_key].append(current_task)
             
             # Check if due today (only for tasks WITH a due date)
-            if due_str and not done:
+            if due_str and not done and 'due_today' in needed:
                 try:
-                    due_date = datetime.strptime(due_str, '%Y-%m-%d').date()
+                    due_date = _parse_iso_date(due_str)
                     if due_date == today:
                         result['due_today'].append(current_task)
                 except ValueError:
@@ -208,35 +424,132 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
             # Parse legacy format metadata
             if meta_line.lower().startswith('due:'):
                 due_str = meta_line.split(':', 1)[1].strip()
-                if not current_task['due']:
-                    current_task['due'] = due_str
+                if not current_task.due:
+                    current_task.due = due_str
             elif meta_line.lower().startswith('blocks:'):
-                current_task['blocks'] = meta_line.split(':', 1)[1].strip()
+                current_task.blocks = meta_line.split(':', 1)[1].strip()
             elif meta_line.lower().startswith('owner:'):
-                if not current_task.get('owner'):
-                    current_task['owner'] = meta_line.split(':', 1)[1].strip()
+                if not current_task.owner:
+                    current_task.owner = meta_line.split(':', 1)[1].strip()
     
     return result
 
 
-def load_tasks(personal: bool = False, force_legacy: bool = False) -> tuple[str, dict]:
-    """Load and parse tasks from file."""
+def _cache_file(tasks_file: Path, personal: bool, format: str, needed: frozenset[str]) -> Path:
+    """Get the parsed-task cache path for the current state of tasks_file.
+    
+    The name is keyed by the file's mtime and size, so any edit produces a
+    new entry, and by today's date because due_today depends on it. Each
+    set of needed buckets gets its own entry.
+    """
+    stat = tasks_file.stat()
+    source = f"{tasks_file.resolve()}|{personal}|{format}|v{_CACHE_VERSION}"
+    prefix = hashlib.sha1(source.encode()).hexdigest()[:12]
+    today = datetime.now().date().isoformat()
+    buckets = '+'.join(sorted(needed))
+    return _paths()['CACHE_DIR'] / f"{prefix}-{stat.st_mtime_ns}-{stat.st_size}-{today}-{buckets}.pkl"
+
+
+def _write_cache(cache_file: Path, data: dict) -> None:
+    """Store parsed tasks and drop cache entries for older file states."""
+    # Everything before the bucket list identifies the file and its state
+    current = cache_file.name.rsplit('-', 1)[0] + '-'
+    prefix = cache_file.name.split('-', 1)[0]
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        for old in cache_file.parent.glob(f"{prefix}-*.pkl"):
+            if not old.name.startswith(current):
+                old.unlink(missing_ok=True)
+        
+        # Write then rename so concurrent readers never see a partial file
+        tmp_file = cache_file.with_suffix('.tmp')
+        with tmp_file.open('wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _report_missing(personal: bool, tasks_file: Path) -> NoReturn:
+    """Explain how to configure a missing tasks file and exit."""
+    task_type = "Personal" if personal else "Work"
+    
+    print(f"\n❌ {task_type} tasks file not found: {tasks_file}\n", file=sys.stderr)
+    print("Configure paths via environment variables:", file=sys.stderr)
+    print("  TASK_TRACKER_WORK_FILE=~/path/to/Work Tasks.md", file=sys.stderr)
+    print("  TASK_TRACKER_PERSONAL_FILE=~/path/to/Personal Tasks.md", file=sys.stderr)
+    print("", file=sys.stderr)
+    
+    sys.exit(1)
+
+
+def load_tasks(personal: bool = False, force_legacy: bool = False,
+               needed: frozenset[str] = ALL_BUCKETS) -> dict:
+    """Load and parse tasks from file.
+    
+    Returns only the parse_tasks-style dict of Task lists, not the file
+    content: load_tasks no longer returns a (content, tasks) tuple.
+    Callers that need the text, e.g. to edit the file, should read it
+    and call parse_tasks so their Tasks carry character offsets.
+    
+    Only the needed buckets are filled (see parse_tasks). Parsed results
+    are cached on disk (see _cache_file) so repeated invocations skip
+    parsing while the file is unchanged. On a cache miss the file is
+    memory-mapped and parsed with parse_tasks_bytes, so Task offset and
+    line_len are None.
+    """
     tasks_file, format = get_tasks_file(personal, force_legacy)
     
     if not tasks_file.exists():
-        task_type = "Personal" if personal else "Work"
-        
-        print(f"\n❌ {task_type} tasks file not found: {tasks_file}\n", file=sys.stderr)
-        print("Configure paths via environment variables:", file=sys.stderr)
-        print("  TASK_TRACKER_WORK_FILE=~/path/to/Work Tasks.md", file=sys.stderr)
-        print("  TASK_TRACKER_PERSONAL_FILE=~/path/to/Personal Tasks.md", file=sys.stderr)
-        print("", file=sys.stderr)
-        
-        sys.exit(1)
+        _report_missing(personal, tasks_file)
+    
+    cache_file = _cache_file(tasks_file, personal, format, needed)
+    try:
+        with cache_file.open('rb') as f:
+            return pickle.load(f)
+    except Exception:
+        pass  # Missing or unreadable cache, parse below
     
-    content = tasks_file.read_text()
-    tasks = parse_tasks(content, personal, format)
-    return content, tasks
+    if tasks_file.stat().st_size == 0:
+        # mmap cannot map an empty file
+        tasks = parse_tasks('', personal, format, needed)
+    else:
+        with tasks_file.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            tasks = parse_tasks_bytes(mm, personal, format, needed)
+    _write_cache(cache_file, tasks)
+    return tasks
+
+
+def load_all_tasks(needed: frozenset[str] = ALL_BUCKETS) -> dict[str, dict]:
+    """Load Work and Personal tasks concurrently.
+    
+    A missing file is skipped with a warning so the other can still be
+    shown; if neither exists, the missing Work file is reported as in
+    load_tasks and the script exits.
+    
+    Returns:
+        dict: {'work': tasks, 'personal': tasks} as returned by load_tasks,
+        without entries for missing files
+    """
+    sources = {}
+    missing = {}
+    for kind, personal in (('work', False), ('personal', True)):
+        tasks_file, _ = get_tasks_file(personal)
+        if tasks_file.exists():
+            sources[kind] = personal
+        else:
+            missing[kind] = tasks_file
+            print(f"⚠️ {kind.title()} tasks file not found, skipping: {tasks_file}", file=sys.stderr)
+    
+    if not sources:
+        _report_missing(False, missing['work'])
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            kind: executor.submit(load_tasks, personal, False, needed)
+            for kind, personal in sources.items()
+        }
+        return {kind: future.result() for kind, future in futures.items()}
 
 
 def check_due_date(due: str, check_type: str = 'today') -> bool:
@@ -248,7 +561,7 @@ def check_due_date(due: str, check_type: str = 'today') -> bool:
     week_end = today + timedelta(days=(6 - today.weekday()))
     
     try:
-        due_date = datetime.strptime(due, '%Y-%m-%d').date()
+        due_date = _parse_iso_date(due)
         
         if check_type == 'today':
             return due_date <= today
@@ -262,20 +575,10 @@ def check_due_date(due: str, check_type: str = 'today') -> bool:
     return False
 
 
-def get_section_display_name(section: str, personal: bool = False) -> str:
-    """Get human-readable section name."""
-    section_names = {
-        'q1': '🔴 Q1: Urgent & Important',
-        'q2': '🟡 Q2: Important, Not Urgent',
-        'q3': '🟠 Q3: Waiting / Blocked',
-        'team': '👥 Team Tasks',
-        'backlog': '⚪ Backlog',
-        'done': '✅ Done',
-    }
-    
-    if personal:
-        section_names['q1'] = '🔴 Must Do Today'
-        section_names['q2'] = '🟡 Should Do This Week'
-        section_names['q3'] = '🟠 Waiting On'
+def get_section_display_name(section: int | None, personal: bool = False) -> str:
+    """Get human-readable name for a task's section id."""
+    if section is None:
+        return 'Uncategorized'
     
-    return section_names.get(section, section or 'Uncategorized')
+    names = _SECTION_NAMES_PERSONAL if personal else _SECTION_NAMES_WORK
+    return names[section]
@@ -4,14 +4,13 @@ Weekly Review Generator - Summarizes last week and plans this week.
 """
 
 import argparse
-import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from utils import (
     get_tasks_file,
-    ARCHIVE_DIR,
+    get_archive_dir,
     get_current_quarter,
     parse_tasks,
     load_tasks,
@@ -25,28 +24,38 @@ def archive_done_tasks(content: str, done_tasks: list) -> str:
     
     # Create archive entry
     quarter = get_current_quarter()
-    archive_file = ARCHIVE_DIR / f"ARCHIVE-{quarter}.md"
+    archive_file = get_archive_dir() / f"ARCHIVE-{quarter}.md"
     
     archive_entry = f"\n## Week of {datetime.now().strftime('%Y-%m-%d')}\n\n"
     for task in done_tasks:
-        archive_entry += f"- ✅ **{task['title']}**\n"
-    
-    # Append to archive
-    if archive_file.exists():
-        archive_content = archive_file.read_text()
-    else:
-        archive_content = f"# Task Archive - {quarter}\n"
-    
-    archive_content += archive_entry
-    archive_file.write_text(archive_content)
-    
-    # Clear done section in original content
-    done_section_pattern = r'(## ✅ Done.*?\n\n).*?(\n## |\n---|\Z)'
-    new_content = re.sub(
-        done_section_pattern,
-        r'\1_Move completed items here during daily standup_\n\n\2',
-        content,
-        flags=re.DOTALL
+        archive_entry += f"- ✅ **{task.title}**\n"
+    
+    # Append to archive without rewriting earlier entries
+    if not archive_file.exists():
+        archive_file.write_text(f"# Task Archive - {quarter}\n")
+    with archive_file.open('a') as f:
+        f.write(archive_entry)
+    
+    # Clear done section in original content: keep the header block up to
+    # its first blank line and drop everything until the next section or rule
+    start = content.find('## ✅ Done')
+    if start == -1:
+        return content
+    header_end = content.find('\n\n', start)
+    if header_end == -1:
+        return content
+    header_end += 2
+    
+    end_candidates = [
+        content.find('\n## ', header_end),
+        content.find('\n---', header_end),
+    ]
+    section_end = min((i for i in end_candidates if i != -1), default=len(content))
+    
+    new_content = (
+        content[:header_end]
+        + '_Move completed items here during daily standup_\n\n'
+        + content[section_end:]
     )
     
     return new_content
@@ -54,7 +63,7 @@ def archive_done_tasks(content: str, done_tasks: list) -> str:
 
 def generate_weekly_review(archive: bool = False) -> str:
     """Generate weekly review summary."""
-    _, tasks_data = load_tasks()
+    tasks_data = load_tasks()
     
     today = datetime.now()
     week_start = today - timedelta(days=today.weekday())
@@ -67,44 +76,44 @@ def generate_weekly_review(archive: bool = False) -> str:
     lines.append(f"✅ **Completed:** {done_count} items")
     if tasks_data['done']:
         for t in tasks_data['done'][:5]:
-            lines.append(f"  • {t['title']}")
+            lines.append(f"  • {t.title}")
         if done_count > 5:
             lines.append(f"  • ... and {done_count - 5} more")
     lines.append("")
     
     # What got pushed (Q1 items still open)
-    open_q1 = [t for t in tasks_data.get('q1', []) if not t['done']]
+    open_q1 = [t for t in tasks_data.get('q1', []) if not t.done]
     if open_q1:
         lines.append(f"⏳ **Still Open (Urgent):** {len(open_q1)} items")
         for t in open_q1[:5]:
-            due_str = f" (due: {t['due']})" if t.get('due') else ""
-            lines.append(f"  • {t['title']}{due_str}")
+            due_str = f" (due: {t.due})" if t.due else ""
+            lines.append(f"  • {t.title}{due_str}")
         lines.append("")
     
     # Waiting/Blocked
-    waiting = [t for t in tasks_data.get('q3', []) if not t['done']]
+    waiting = [t for t in tasks_data.get('q3', []) if not t.done]
     if waiting:
         lines.append(f"🟠 **Waiting/Blocked:** {len(waiting)} items")
         for t in waiting[:3]:
-            blocks_str = f" → {t['blocks']}" if t.get('blocks') else ""
-            lines.append(f"  • {t['title']}{blocks_str}")
+            blocks_str = f" → {t.blocks}" if t.blocks else ""
+            lines.append(f"  • {t.title}{blocks_str}")
         lines.append("")
     
     # This week's priorities (Q1 tasks)
     lines.append("🎯 **This Week's Priorities:**")
     priorities = tasks_data.get('q1', [])[:5]
     for i, t in enumerate(priorities, 1):
-        due_str = f" (due: {t['due']})" if t.get('due') else ""
-        lines.append(f"  {i}. {t['title']}{due_str}")
+        due_str = f" (due: {t.due})" if t.due else ""
+        lines.append(f"  {i}. {t.title}{due_str}")
     lines.append("")
     
     # Upcoming deadlines (Q2 tasks with due dates)
-    upcoming = [t for t in tasks_data.get('q2', []) if t.get('due')]
+    upcoming = [t for t in tasks_data.get('q2', []) if t.due]
     if upcoming:
         lines.append("📅 **Upcoming Deadlines:**")
         for t in upcoming[:5]:
-            due_str = f" — {t['due']}" if t.get('due') else ""
-            lines.append(f"  • {t['title']}{due_str}")
+            due_str = f" — {t.due}" if t.due else ""
+            lines.append(f"  • {t.title}{due_str}")
     
     # Archive if requested
     if archive and tasks_data['done']: